@@ -1,8 +1,36 @@
 class Gifter:
-    def __init__(self, name, seniority):
+    __slots__ = ('name', 'emoji', 'seniority')
+    
+    # Set to True to keep state between games instead of being reset
+    keep_memory = False
+    
+    # Per-class state that reset() clears, worked out once in __init_subclass__
+    _reset_slots = ()
+    _has_dict = False
+    
+    def __init__(self, name, seniority, emoji="🎁"):
         self.name = name
+        self.emoji = emoji
         self.seniority = seniority
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        reset_slots = []
+        for klass in cls.__mro__:
+            if klass is Gifter or klass is object:
+                continue
+            slots = klass.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for slot in slots:
+                if slot in ('__dict__', '__weakref__'):
+                    continue
+                if slot.startswith('__') and not slot.endswith('__'):
+                    slot = f"_{klass.__name__.lstrip('_')}{slot}"  # Private names are mangled
+                reset_slots.append(slot)
+        cls._reset_slots = tuple(reset_slots)
+        cls._has_dict = cls.__dictoffset__ != 0
+    
     def propose_distribution(self, num_gifts, num_gifters):
         raise NotImplementedError("Each gifter must implement their own distribution strategy")
     
@@ -12,6 +40,16 @@ class Gifter:
     def update_seniority(self, new_seniority):
         self.seniority = new_seniority
     
+    def reset(self, seniority):
+        # Called between games: clears everything except name and emoji, then takes the new seat.
+        # Override (calling super().reset) to rebuild state your __init__ sets up.
+        for slot in self._reset_slots:
+            if hasattr(self, slot):
+                delattr(self, slot)
+        if self._has_dict:
+            self.__dict__.clear()
+        self.seniority = seniority
+    
 class YourGifter(Gifter):
     def propose_distribution(self, num_gifts: int, num_gifters: int) -> list:
         """
@@ -27,12 +65,12 @@ class YourGifter(Gifter):
         """
         pass
 
-    def vote(self, distribution: list, num_gifts: int, num_gifters: int) -> bool:
+    def vote(self, distribution: memoryview, num_gifts: int, num_gifters: int) -> bool:
         """
         Vote on a proposed distribution.
         
         Args:
-            distribution: Proposed distribution of gifts
+            distribution: Proposed distribution of gifts, as a read-only memoryview of ints
             num_gifts: Total number of gifts
             num_gifters: Number of players still in game
             
@@ -43,6 +81,8 @@ class YourGifter(Gifter):
 
 class GreedyGifter(Gifter): 
     # Takes almost everything, gives minimum to others
+    __slots__ = ()
+
     def propose_distribution(self, num_gifts, num_gifters):
         distribution = [0] * num_gifters
         distribution[0] = num_gifts - (num_gifters - 1)  # Keep almost everything
@@ -58,6 +98,8 @@ class GreedyGifter(Gifter):
 
 class FairGifter(Gifter):
     # Distributes gifts equally
+    __slots__ = ()
+
     def propose_distribution(self, num_gifts, num_gifters):
         base_share = num_gifts // num_gifters
         remainder = num_gifts % num_gifters
@@ -75,6 +117,7 @@ class FairGifter(Gifter):
         return abs(distribution[self.seniority] - average) <= 1
 
 class RandomGifter(Gifter):
+    __slots__ = ()
 
     def propose_distribution(self, num_gifts, num_gifters):
         import numpy as np
@@ -1,9 +1,36 @@
 class Gifter:
+    __slots__ = ('name', 'emoji', 'seniority')
+    
+    # Set to True to keep state between games instead of being reset
+    keep_memory = False
+    
+    # Per-class state that reset() clears, worked out once in __init_subclass__
+    _reset_slots = ()
+    _has_dict = False
+    
     def __init__(self, name, emoji, seniority):
         self.name = name
         self.emoji = emoji
         self.seniority = seniority
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        reset_slots = []
+        for klass in cls.__mro__:
+            if klass is Gifter or klass is object:
+                continue
+            slots = klass.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for slot in slots:
+                if slot in ('__dict__', '__weakref__'):
+                    continue
+                if slot.startswith('__') and not slot.endswith('__'):
+                    slot = f"_{klass.__name__.lstrip('_')}{slot}"  # Private names are mangled
+                reset_slots.append(slot)
+        cls._reset_slots = tuple(reset_slots)
+        cls._has_dict = cls.__dictoffset__ != 0
+    
     def propose_distribution(self, num_gifts, num_gifters):
         raise NotImplementedError("Each gifter must implement their own distribution strategy")
     
@@ -13,7 +40,18 @@ class Gifter:
     def update_seniority(self, new_seniority):
         self.seniority = new_seniority
     
+    def reset(self, seniority):
+        # Called between games: clears everything except name and emoji, then takes the new seat.
+        # Override (calling super().reset) to rebuild state your __init__ sets up.
+        for slot in self._reset_slots:
+            if hasattr(self, slot):
+                delattr(self, slot)
+        if self._has_dict:
+            self.__dict__.clear()
+        self.seniority = seniority
+    
 class TheGrinch(Gifter):
+    __slots__ = ()
     def __init__(self, name, seniority):
         super().__init__(name, "🤢", seniority)  # Brain
 
@@ -55,6 +93,7 @@ class TheGrinch(Gifter):
         return distribution[self.seniority] > 0
 
 class GimmeGimmeGimme(Gifter):
+    __slots__ = ()
     def __init__(self, name, seniority):
         super().__init__(name, "🤑", seniority)  # Party
     def propose_distribution(self, num_gifts: int, num_gifters: int) -> list:
@@ -63,7 +102,7 @@ class GimmeGimmeGimme(Gifter):
         distribution[0] = num_gifts
         return distribution
 
-    def vote(self, distribution: list, num_gifts: int, num_gifters: int) -> bool:
+    def vote(self, distribution: memoryview, num_gifts: int, num_gifters: int) -> bool:
         """Accept only if I get it all!"""
         if self.seniority == 0:
             return True
@@ -73,6 +112,7 @@ class GimmeGimmeGimme(Gifter):
             return False
 
 class NoGift4U(Gifter):
+    __slots__ = ()
     def __init__(self, name, seniority):
         super().__init__(name, "🍲", seniority)  # Party
     # Based on pirate strategy - only allocate gifts to every second gifter. But more generous - allocate base share to each
@@ -92,6 +132,7 @@ class NoGift4U(Gifter):
         return distribution[self.seniority] > 0 and self.seniority != 1  # Accept any non-zero offer when not next in line of seniority
 
 class RevelrousRyan(Gifter):
+    __slots__ = ()
     def __init__(self, name, seniority):
         super().__init__(name, "🥺", seniority)  # Party
 
@@ -110,12 +151,12 @@ class RevelrousRyan(Gifter):
         per_person_gift = int(num_gifts/num_gifters)
         return [num_gifts - (per_person_gift * (num_gifters - 1))] + [per_person_gift] * (num_gifters - 1)
 
-    def vote(self, distribution: list, num_gifts: int, num_gifters: int) -> bool:
+    def vote(self, distribution: memoryview, num_gifts: int, num_gifters: int) -> bool:
         """
         Vote on a proposed distribution.
 
         Args:
-            distribution: Proposed distribution of gifts
+            distribution: Proposed distribution of gifts, as a read-only memoryview of ints
             num_gifts: Total number of gifts
             num_gifters: Number of players still in game
 
@@ -125,6 +166,7 @@ class RevelrousRyan(Gifter):
         return False
 
 class QuackQuackQuack(Gifter):
+    __slots__ = ()
     def __init__(self, name, seniority):
         super().__init__(name, "🦆", seniority)  # Duck
 
@@ -147,7 +189,7 @@ class QuackQuackQuack(Gifter):
         res[0] = num_gifts - a * needed
         return res
 
-    def vote(self, distribution: list, num_gifts: int, num_gifters: int) -> bool:
+    def vote(self, distribution: memoryview, num_gifts: int, num_gifters: int) -> bool:
         if self.seniority == 0:
             return True
         elif num_gifters == 3 and self.seniority == 1:
@@ -157,6 +199,7 @@ class QuackQuackQuack(Gifter):
             return distribution[self.seniority] >= reject_expectation
 
 class MrGauss(Gifter):
+    __slots__ = ()
     def __init__(self, name, seniority):
         super().__init__(name, "🧐", seniority)  # Chart
 
@@ -180,7 +223,7 @@ class MrGauss(Gifter):
             distr[index] += 1
         return distr
 
-    def vote(self, distribution: list, num_gifts: int, num_gifters: int) -> bool:
+    def vote(self, distribution: memoryview, num_gifts: int, num_gifters: int) -> bool:
         """
         If the distribution looks gaussian enough - accept.
         """
@@ -198,6 +241,7 @@ class MrGauss(Gifter):
             return test < 5
 
 class Harpo(Gifter):
+    __slots__ = ()
     def __init__(self, name, seniority):
         super().__init__(name, "🤗", seniority)  # Chart
     def propose_distribution(self, num_gifts, num_gifters):
@@ -286,6 +330,7 @@ class Harpo(Gifter):
         return my_share > 0
 
 class M_gifter(Gifter):
+    __slots__ = ()
     def __init__(self, name, seniority):
         super().__init__(name, "🌻", seniority)  # Chart
     def propose_distribution(self, num_gifts, num_gifters):
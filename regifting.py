@@ -1,9 +1,47 @@
+from array import array
 from collections import defaultdict
+from itertools import islice
+import numbers
 import random
 import time
-from typing import List, Dict, Type
+from typing import List, Dict, Type, Union
 import pandas as pd
 
+class Roster:
+    """
+    Play order of pooled gifters, stored as a compact array of seat numbers.
+    
+    A seat is the gifter's index in the pool. The seats are resolved to
+    gifters once per game; eliminating the director then moves the start of
+    the roster forward instead of copying the list, and each gifter's
+    seniority is its position counted from that start.
+    """
+    __slots__ = ('seats', 'gifters', 'start')
+    
+    def __init__(self, pool: List, seats: array):
+        self.seats = seats
+        self.gifters = list(map(pool.__getitem__, seats))
+        self.start = 0
+    
+    def __len__(self) -> int:
+        return len(self.gifters) - self.start
+    
+    def __getitem__(self, seniority: int):
+        if seniority < 0:
+            raise IndexError("roster index out of range")
+        return self.gifters[self.start + seniority]
+    
+    def __iter__(self):
+        return islice(self.gifters, self.start, None)
+    
+    def voters(self):
+        """Iterate over all gifters except the director."""
+        return islice(self.gifters, self.start + 1, None)
+    
+    def eliminate_director(self):
+        """Remove the current director, promoting everyone else by one seniority."""
+        self.start += 1
+
 class GiftingGame:
     """
     A class that manages the regifting game simulation where players propose and vote on gift distributions.
@@ -35,60 +73,119 @@ class GiftingGame:
             'total_gifts_distributed': defaultdict(int),  # Track total gifts distributed
             'votes_cast': {'Accept': 0, 'Reject': 0},  # Track all votes
         }
+    
+    @property
+    def gifter_classes(self) -> List[Type]:
+        return self._gifter_classes
+    
+    @gifter_classes.setter
+    def gifter_classes(self, gifter_classes: List[Type]):
+        # Assigning a new class list discards the pool built for the old one
+        self._gifter_classes = gifter_classes
+        self._gifter_pool = []  # One reusable gifter instance per class, indexed by seat
+        self._resettable = []  # (seat, gifter) pairs that are reset between games
 
-    def _create_gifters(self, rotation: int) -> List:
+    def _create_gifters(self, rotation: int) -> Roster:
         """
-        Create and arrange gifters for a game round.
+        Reset the pooled gifters and arrange them for a game round.
+        
+        Gifters are created once per class and reused across games. Between
+        games each one's per-game state is cleared with `reset()`, unless its
+        class sets `keep_memory = True` to carry state from game to game. The
+        pool is rebuilt after a new list is assigned to `gifter_classes`;
+        changing the existing list in place is not tracked.
         
         Args:
             rotation: Number of positions to rotate the initial order
             
         Returns:
-            List of initialized gifter objects in play order
+            Roster of pooled gifters in play order
         """
-        # Create gifters with their initial positions and emojis
-        original_order = [
-            gifter_class(f"{gifter_class.__name__}", i)  # Default emoji if none specified
-            for i, gifter_class in enumerate(self.gifter_classes)
-        ]
+        if not self._gifter_pool:
+            self._gifter_pool = [
+                gifter_class(f"{gifter_class.__name__}", i)
+                for i, gifter_class in enumerate(self.gifter_classes)
+            ]
+            self._resettable = [
+                (seat, gifter) for seat, gifter in enumerate(self._gifter_pool)
+                if not gifter.keep_memory
+            ]
+        else:
+            for seat, gifter in self._resettable:
+                gifter.reset(seat)
         
         # Rotate order based on game number
-        gifters = original_order[rotation:] + original_order[:rotation]
+        seats = list(range(len(self._gifter_pool)))
+        seats = seats[rotation:] + seats[:rotation]
         
         # Randomize non-director positions
-        return [gifters[0]] + random.sample(gifters[1:], len(gifters[1:]))
+        order = [seats[0]] + random.sample(seats[1:], len(seats[1:]))
+        return Roster(self._gifter_pool, array('H', order))
 
-    def _validate_distribution(self, distribution: List[int], num_gifters: int) -> bool:
+    def _validate_distribution(self, distribution: List[int], num_gifters: int) -> memoryview:
         """
-        Validate if a proposed distribution is valid.
+        Validate a proposed distribution and freeze it into a read-only integer buffer.
+        
+        The same buffer is handed to every voter, so no voter can alter the
+        proposal seen by the next one.
         
         Args:
             distribution: Proposed distribution of presents
             num_gifters: Current number of gifters
             
         Returns:
-            bool: Whether distribution is valid
+            Read-only view of the shares
+            
+        Raises:
+            ValueError: If the distribution is invalid, with the reason why
         """
+        try:
+            num_shares = len(distribution)
+        except TypeError:
+            raise ValueError(f"Expected a list of shares, got {type(distribution).__name__}") from None
+        
         # Check if distribution has correct length
-        if len(distribution) != num_gifters:
-            return False
-            
-        # Calculate sum of distribution
-        total = sum(distribution)
+        if num_shares != num_gifters:
+            raise ValueError(f"Expected {num_gifters} shares, got {num_shares}")
+        
+        shares = array('q')
+        for i, share in enumerate(distribution):
+            # Whole-number floats are accepted, fractional shares are not
+            if isinstance(share, float) and share.is_integer():
+                share = int(share)
+            elif isinstance(share, bool) or not isinstance(share, numbers.Integral):
+                raise ValueError(f"Share {i + 1} is not a whole number: {share!r}")
+            if share < 0:
+                raise ValueError(f"Share {i + 1} is negative: {share}")
+            if share > self.num_presents:
+                raise ValueError(f"Share {i + 1} exceeds the {self.num_presents} presents available: {share}")
+            shares.append(int(share))
         
-        # Allow for small floating point differences that can be rounded
-        return abs(total - self.num_presents) < 1
+        # Shares must add up to exactly the number of presents
+        total = sum(shares)
+        if total != self.num_presents:
+            raise ValueError(f"Expected shares totaling {self.num_presents}, got {total}")
         
-    def _process_votes(self, gifters: List, distribution: List[int]) -> Dict:
+        return memoryview(shares).toreadonly()
+        
+    def _cast_vote(self, gifter, distribution: memoryview, num_gifters: int) -> bool:
+        """Ask a gifter for their vote, treating an error in their strategy as a rejection."""
+        try:
+            return bool(gifter.vote(distribution, self.num_presents, num_gifters))
+        except Exception as error:
+            print(f"{gifter.name} failed to vote ({type(error).__name__}: {error}), counted as Reject")
+            return False
+    
+    def _process_votes(self, gifters: Roster, distribution: memoryview) -> Dict:
         """Collect and process votes for a proposed distribution."""
         num_gifters = len(gifters)
         
         votes = ['Accept']  # Director's vote
-        votes.extend(['Accept' if gifter.vote(distribution, self.num_presents, num_gifters) 
-                     else 'Reject' for gifter in gifters[1:]])
+        votes.extend(['Accept' if self._cast_vote(gifter, distribution, num_gifters) 
+                     else 'Reject' for gifter in gifters.voters()])
         
         # Track individual votes (excluding director's vote)
-        for gifter, vote in zip(gifters[1:], votes[1:]):
+        for gifter, vote in zip(gifters.voters(), votes[1:]):
             self.stats[('votes', gifter.__class__.__name__, vote)] = \
                 self.stats.get(('votes', gifter.__class__.__name__, vote), 0) + 1
         
@@ -102,47 +199,50 @@ class GiftingGame:
             'is_accepted': accept_count >= num_gifters / 2
         }
 
-    def play_single_game(self, gifters: List) -> Dict[str, int]:
+    def play_single_game(self, gifters: Union[Roster, List]) -> Dict[str, int]:
         """
         Play a single game of regifting.
         
         Args:
-            gifters: List of gifters participating in the game
+            gifters: Roster or list of gifters participating in the game, in play order
             
         Returns:
             Dict mapping gifter names to their final present counts
         """
+        if not isinstance(gifters, Roster):
+            gifters = Roster(list(gifters), array('H', range(len(gifters))))
         num_gifters = len(gifters)
         final_distribution = {}
         
-        # Update seniority of all gifters at the start
-        for i, gifter in enumerate(gifters):
-            gifter.update_seniority(i)
-        
         while num_gifters > 0:
+            # Update seniority of remaining gifters, including after an invalid proposal
+            for i, gifter in enumerate(gifters):
+                gifter.update_seniority(i)
+            
             director = gifters[0]
             distribution = director.propose_distribution(self.num_presents, num_gifters)
             
             # Track proposal statistics
             self.stats['proposals'][director.__class__.__name__] += 1
             
-            # Display proposed distribution
             print(f"\nDirector {director.name} {director.emoji} proposes:")
             
-            for i, (gifter, count) in enumerate(zip(gifters, distribution)):
-                print(f"{i + 1}. {gifter.name} {gifter.emoji}: {count}")
-            
-            # Validate distribution
-            if not self._validate_distribution(distribution, num_gifters):
+            # Validate distribution before displaying it
+            try:
+                shares = self._validate_distribution(distribution, num_gifters)
+            except ValueError as error:
+                print(repr(distribution))
                 print(f"Invalid distribution from {director.name}")
-                print(f"Expected {num_gifters} shares totaling {self.num_presents}")
-                print(f"Got {len(distribution)} shares totaling {sum(distribution)}")
-                gifters = gifters[1:]
+                print(error)
+                gifters.eliminate_director()
                 num_gifters -= 1
                 continue
             
+            for i, (gifter, count) in enumerate(zip(gifters, shares)):
+                print(f"{i + 1}. {gifter.name} {gifter.emoji}: {count}")
+            
             # Process votes
-            vote_results = self._process_votes(gifters, distribution)
+            vote_results = self._process_votes(gifters, shares)
             
             print("\nVotes:")
             for i, (name, vote) in enumerate(vote_results['tally'].items()):
@@ -157,21 +257,17 @@ class GiftingGame:
             if vote_results['is_accepted']:
                 self.stats['accepted_proposals'][director.__class__.__name__] += 1
                 # Track self-gifts and total gifts distributed
-                self.stats['self_gifts'][director.__class__.__name__] += distribution[0]
-                self.stats['total_gifts_distributed'][director.__class__.__name__] += sum(distribution)
+                self.stats['self_gifts'][director.__class__.__name__] += shares[0]
+                self.stats['total_gifts_distributed'][director.__class__.__name__] += sum(shares)
                 print("✅ Distribution accepted!")
-                final_distribution.update({gifter.name: count for gifter, count in zip(gifters, distribution)})
+                final_distribution.update({gifter.name: count for gifter, count in zip(gifters, shares)})
                 break
             else:
                 print(f"Christmas is cancelled for {director.name} {director.emoji}!")
                 print(f"{gifters[1].name} {gifters[1].emoji} is the new director!")
                 final_distribution[director.name] = 0
-                gifters = gifters[1:]
+                gifters.eliminate_director()
                 num_gifters -= 1
-            
-            # Update seniority of remaining gifters
-            for i, gifter in enumerate(gifters):
-                gifter.update_seniority(i)
         
         # Handle last gifter or incomplete distribution
         if not final_distribution and num_gifters == 1: